@@ -1,4 +1,8 @@
+import sys
+import weakref
+
 from datetime import datetime
+from uuid import UUID
 
 '''Helpers for de/serializing JSON
 '''
@@ -225,3 +229,104 @@ class JsonSerde(Field, metaclass=JsonSerdeMeta):
                 continue
             out[name] = field.serde.to_json(value)
         return out
+
+
+# Keyed on ``UUID.int`` so the only reference to the UUID itself is the weak one, and entries
+# are dropped once no model holds that UUID. ``sys.intern`` strings are likewise freed once unused.
+_INTERNED_UUIDS = weakref.WeakValueDictionary()
+
+
+def intern(value):
+    '''Return a canonical instance of ``value`` so repeated UUIDs and strings share memory and
+       compare by identity first.
+    '''
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, UUID):
+        try:
+            return _INTERNED_UUIDS.setdefault(value.int, value)
+        except TypeError:
+            # a UUID subclass that declares ``__slots__`` without ``__weakref__``
+            return value
+    return value
+
+
+class FrozenMeta(type):
+
+    def __new__(cls, name, bases, attrs):
+        fields = tuple(attrs.get('__fields__', ()))
+        for i, field_name in enumerate(fields):
+            attrs[field_name] = property(lambda self, i=i: self._values[i])
+        attrs['__fields__'] = fields
+        attrs.setdefault('__slots__', ())
+        return type.__new__(cls, name, bases, attrs)
+
+
+class Frozen(metaclass=FrozenMeta):
+    '''Immutable, hashable copy of a model. Values are interned and the hash is computed once.
+       Subclasses set ``__model__`` to the mutable model and ``__fields__`` to its field names.
+    '''
+
+    __slots__ = ('_values', '_hash')
+    __model__ = None
+
+    def __init__(self, *values) -> None:
+        if len(values) != len(self.__fields__):
+            raise TypeError('{}() takes {} values, got {}'.format(self.__class__.__name__,
+                                                                  len(self.__fields__),
+                                                                  len(values)))
+        values = tuple(intern(v) for v in values)
+        object.__setattr__(self, '_values', values)
+        object.__setattr__(self, '_hash', hash(values))
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(*(getattr(model, name) for name in cls.__fields__))
+
+    @classmethod
+    def from_json(cls, value):
+        return cls.from_model(cls.__model__.from_json(value))
+
+    def thaw(self):
+        '''Return a mutable instance of ``__model__`` with the same values.
+        '''
+        return self.__model__(**dict(zip(self.__fields__, self._values)))
+
+    def to_json(self):
+        return self.thaw().to_json()
+
+    def diff(self, other) -> dict:
+        '''Return ``{field: (self_value, other_value)}`` for every field that differs.
+        '''
+        if not isinstance(other, self.__class__):
+            raise TypeError('Can only diff against another {}'.format(self.__class__.__name__))
+        if self._values == other._values:
+            return {}
+        return {name: (a, b)
+                for name, a, b in zip(self.__fields__, self._values, other._values)
+                if a != b}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self._hash == other._hash and self._values == other._values
+
+    def __ne__(self, other) -> bool:
+        return not self.__eq__(other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __setattr__(self, name, value) -> None:
+        raise AttributeError('{} is frozen'.format(self.__class__.__name__))
+
+    def __delattr__(self, name) -> None:
+        raise AttributeError('{} is frozen'.format(self.__class__.__name__))
+
+    def __reduce__(self):
+        return (self.__class__, self._values)
+
+    def __repr__(self) -> str:
+        return '{}({})'.format(self.__class__.__name__,
+                               ', '.join('{}={!r}'.format(n, v)
+                                         for n, v in zip(self.__fields__, self._values)))
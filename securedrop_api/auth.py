@@ -1,10 +1,8 @@
-import json as json_
-import requests
-
 from json_serde import JsonSerde, String, IsoDateTime
 
 from . import API_V1
 from .exc import ApiException
+from .transport import Transport, RequestsTransport
 
 '''Helpers for authentication
 '''
@@ -33,8 +31,10 @@ class Authentication:
     '''Abstract class for authentication.
     '''
 
-    def authenticate(self, url_base: str):
+    def authenticate(self, url_base: str, transport: Transport=None):
         ''':param url_base: The SecureDrop API base URL
+           :param transport: The :class:`.transport.Transport` to use. Defaults to a
+                             :class:`.transport.RequestsTransport`.
         '''
         raise NotImplementedError
 
@@ -69,13 +69,16 @@ class AuthToken(Authentication, JsonSerde):
     def auth_args(self) -> AuthArgs:
         return AuthArgs(headers={'Authorization': 'Token {}'.format(self.token)})
 
-    def authenticate(self, url_base: str) -> Authentication:
-        resp = requests.post(url_base + API_V1 + 'token',
-                             headers={'Accept': 'application/json',
-                                      'Content-Type': 'application/json',
-                                      'Authorization': 'Token {}'.format(self.token)})
+    def authenticate(self, url_base: str, transport: Transport=None) -> Authentication:
+        if transport is None:
+            with RequestsTransport() as transport:
+                return self.authenticate(url_base, transport)
+        resp = transport.request('POST', url_base + API_V1 + 'token',
+                                 headers={'Accept': 'application/json',
+                                          'Content-Type': 'application/json',
+                                          'Authorization': 'Token {}'.format(self.token)})
         self.check_auth_resp(resp)
-        return Authentication
+        return self
 
 
 class UserPassOtp(Authentication):
@@ -90,13 +93,15 @@ class UserPassOtp(Authentication):
                               'passphrase': self.passphrase,
                               'one_time_code': self.one_time_code})
 
-    def authenticate(self, url_base: str) -> Authentication:
-        resp = requests.post(url_base + API_V1 + 'token',
-                             headers={'Accept': 'application/json',
-                                      'Content-Type': 'application/json'},
-                             data=json_.dumps({'username': self.username,
-                                               'passphrase': self.passphrase,
-                                               'one_time_code': self.one_time_code}),
-                             allow_redirects=True)
+    def authenticate(self, url_base: str, transport: Transport=None) -> Authentication:
+        if transport is None:
+            with RequestsTransport() as transport:
+                return self.authenticate(url_base, transport)
+        resp = transport.request('POST', url_base + API_V1 + 'token',
+                                 headers={'Accept': 'application/json',
+                                          'Content-Type': 'application/json'},
+                                 json={'username': self.username,
+                                       'passphrase': self.passphrase,
+                                       'one_time_code': self.one_time_code})
         data = self.check_auth_resp(resp)
         return AuthToken.from_json(data)
@@ -0,0 +1,277 @@
+import argparse
+import csv
+import getpass
+import json
+import os
+import sys
+import time
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from . import __version__
+
+'''Command line interface for bulk exports
+'''
+
+
+class Stats:
+    '''Throughput and latency counters for an export.
+    '''
+
+    def __init__(self) -> None:
+        self.start = time.monotonic()
+        self.rows = 0
+        self.latencies = []
+
+    def timed(self, func, *nargs, **kwargs):
+        start = time.monotonic()
+        try:
+            return func(*nargs, **kwargs)
+        finally:
+            self.latencies.append(time.monotonic() - start)
+
+    def summary(self) -> str:
+        elapsed = time.monotonic() - self.start
+        lat = sorted(self.latencies)
+
+        def pct(p: float) -> float:
+            if not lat:
+                return 0.0
+            return lat[min(len(lat) - 1, int(p * len(lat)))] * 1000
+
+        return ('rows={} requests={} elapsed={:.3f}s rows/s={:.1f} '
+                'latency_ms p50={:.1f} p95={:.1f} max={:.1f}').format(
+                    self.rows, len(lat), elapsed, self.rows / elapsed if elapsed else 0.0,
+                    pct(0.50), pct(0.95), pct(1.0))
+
+
+class Writer:
+    '''Streams rows as NDJSON or CSV.
+    '''
+
+    def __init__(self, out, fmt: str, write_header: bool=True) -> None:
+        self.out = out
+        self.fmt = fmt
+        self.write_header = write_header
+        self.__csv = None
+
+    def tell(self) -> int:
+        '''Flush and return the size of the output file in bytes.
+        '''
+        self.out.flush()
+        return os.fstat(self.out.fileno()).st_size
+
+    def write(self, row: dict) -> None:
+        if self.fmt == 'ndjson':
+            self.out.write(json.dumps(row, separators=(',', ':'), default=str))
+            self.out.write('\n')
+            return
+
+        if self.__csv is None:
+            self.__csv = csv.DictWriter(self.out, fieldnames=list(row.keys()),
+                                        extrasaction='ignore')
+            if self.write_header:
+                self.__csv.writeheader()
+        self.__csv.writerow(row)
+
+
+class Checkpoint:
+    '''Records which sources have been fully exported, and the size of the output after each, so
+       an interrupted export can resume. Each line is ``<uuid> <offset>``.
+    '''
+
+    def __init__(self, path: str=None) -> None:
+        self.path = path
+        self.done = set()
+        self.offset = 0
+        self.exists = bool(path and os.path.exists(path))
+        if self.exists:
+            with open(path) as f:
+                for line in f:
+                    parts = line.split()
+                    # a crash while appending can leave a partial last line
+                    if len(parts) != 2 or not parts[1].isdigit():
+                        continue
+                    self.done.add(parts[0])
+                    self.offset = max(self.offset, int(parts[1]))
+
+    def truncate(self, output: str) -> None:
+        '''Discard anything written to ``output`` after the last completed source.
+        '''
+        size = os.path.getsize(output) if os.path.exists(output) else 0
+        if size < self.offset:
+            raise SystemExit('{} is shorter than checkpoint {} records'.format(output, self.path))
+        if os.path.exists(output):
+            os.truncate(output, self.offset)
+
+    def mark(self, uuid, offset: int) -> None:
+        if self.path:
+            with open(self.path, 'a') as f:
+                f.write('{} {}\n'.format(uuid, offset))
+        self.done.add(str(uuid))
+        self.offset = offset
+
+    def finish(self) -> None:
+        '''Remove the checkpoint once the export has completed so the next run starts afresh.
+        '''
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _prompt(prompt: str) -> str:
+    # stdout may be the export itself, so prompt on stderr like ``getpass`` does
+    sys.stderr.write(prompt)
+    sys.stderr.flush()
+    return sys.stdin.readline().rstrip('\n')
+
+
+def _transport(args):
+    from .transport import Http2Transport, RequestsTransport
+
+    if args.http2:
+        # cleartext (e.g. onion) URLs can't negotiate HTTP/2, so assume the server speaks it
+        return Http2Transport(prior_knowledge=args.url.startswith('http://'))
+    return RequestsTransport(pool_maxsize=args.workers)
+
+
+def _client(args, transport):
+    from .auth import UserPassOtp
+    from .client import Client
+
+    username = args.username or os.environ.get('SECUREDROP_USERNAME')
+    passphrase = os.environ.get('SECUREDROP_PASSPHRASE') or getpass.getpass('Passphrase: ')
+    one_time_code = (args.one_time_code or os.environ.get('SECUREDROP_ONE_TIME_CODE')
+                     or _prompt('One time code: '))
+    return Client(args.url, UserPassOtp(username, passphrase, one_time_code),
+                  transport=transport)
+
+
+def export_sources(client, writer: Writer, stats: Stats, checkpoint: Checkpoint, args) -> None:
+    sources = stats.timed(client.sources)
+    for source in sources.sources:
+        writer.write(source.to_json())
+        stats.rows += 1
+
+
+def export_user(client, writer: Writer, stats: Stats, checkpoint: Checkpoint, args) -> None:
+    user = stats.timed(client.user)
+    # the model's own serialization keeps datetimes in the same ISO format as the other exports
+    writer.write(user.to_json()['user'])
+    stats.rows += 1
+
+
+def export_submissions(client, writer: Writer, stats: Stats, checkpoint: Checkpoint,
+                       args) -> None:
+    sources = stats.timed(client.sources)
+    todo = (s.uuid for s in sources.sources if str(s.uuid) not in checkpoint.done)
+
+    def fetch(uuid):
+        return uuid, stats.timed(client.source_submissions, uuid)
+
+    # at most ``2 * workers`` results are held in memory at once
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        pending = deque()
+        for uuid in todo:
+            pending.append(executor.submit(fetch, uuid))
+            if len(pending) >= 2 * args.workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    _write_submissions(future.result(), writer, stats, checkpoint)
+
+        for future in pending:
+            _write_submissions(future.result(), writer, stats, checkpoint)
+
+    checkpoint.finish()
+
+
+def _write_submissions(result, writer: Writer, stats: Stats, checkpoint: Checkpoint) -> None:
+    uuid, submissions = result
+    for submission in submissions.submissions or []:
+        row = {'source_uuid': str(uuid)}
+        row.update(submission.to_json())
+        writer.write(row)
+        stats.rows += 1
+    if checkpoint.path:
+        checkpoint.mark(uuid, writer.tell())
+
+
+EXPORTS = {
+    'sources': export_sources,
+    'submissions': export_submissions,
+    'user': export_user,
+}
+
+
+def parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='securedrop-api',
+                                     description='SecureDrop API client')
+    parser.add_argument('--version', action='version', version=__version__)
+    parser.add_argument('--url', default=os.environ.get('SECUREDROP_URL'),
+                        help='URL of the SecureDrop (default: $SECUREDROP_URL)')
+    parser.add_argument('--username', help='Journalist username (default: $SECUREDROP_USERNAME)')
+    parser.add_argument('--one-time-code',
+                        help='2FA code (default: $SECUREDROP_ONE_TIME_CODE, else prompted for)')
+    parser.add_argument('--http2', action='store_true',
+                        help='Multiplex requests over one HTTP/2 connection (requires httpx)')
+
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+    export = subparsers.add_parser('export', help='Export data as NDJSON or CSV')
+    export.add_argument('what', choices=sorted(EXPORTS.keys()))
+    export.add_argument('--format', choices=('ndjson', 'csv'), default='ndjson')
+    export.add_argument('-o', '--output', help='Output file (default: stdout)')
+    export.add_argument('--workers', type=int, default=4,
+                        help='Concurrent requests when fetching submissions')
+    export.add_argument('--checkpoint',
+                        help='File recording exported sources so the export can be resumed')
+    export.add_argument('--stats', action='store_true',
+                        help='Print a throughput and latency summary to stderr')
+    return parser
+
+
+def main(argv: list=None, client=None) -> int:
+    args = parser().parse_args(argv)
+    if args.workers < 1:
+        raise SystemExit('--workers must be at least 1')
+    if args.checkpoint and args.what != 'submissions':
+        raise SystemExit('--checkpoint is only supported when exporting submissions')
+    if args.checkpoint and not args.output:
+        raise SystemExit('--checkpoint requires --output')
+    if client is None and not args.url:
+        raise SystemExit('--url or $SECUREDROP_URL is required')
+
+    # API, authentication, network and file errors (including those re-raised from the worker
+    # threads) are reported as a single line rather than a traceback
+    try:
+        if client is not None:
+            return _export(client, args)
+        with _transport(args) as transport:
+            return _export(_client(args, transport), args)
+    except Exception as e:
+        print('securedrop-api: {}: {}'.format(type(e).__name__, e), file=sys.stderr)
+        return 1
+
+
+def _export(client, args) -> int:
+    checkpoint = Checkpoint(args.checkpoint)
+    if checkpoint.exists:
+        checkpoint.truncate(args.output)
+    if args.output:
+        out = open(args.output, 'a' if checkpoint.exists else 'w', newline='')
+    else:
+        out = sys.stdout
+
+    stats = Stats()
+    try:
+        writer = Writer(out, args.format, write_header=checkpoint.offset == 0)
+        EXPORTS[args.what](client, writer, stats, checkpoint, args)
+        out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if args.stats:
+        print(stats.summary(), file=sys.stderr)
+    return 0
@@ -1,11 +1,11 @@
-import requests
-
 from typing import Union
+from uuid import UUID
 
 from . import __version__, API_V1
 from .auth import Authentication
 from .data import Sources, Source, Submissions, Submission, Reply, User
 from .exc import ApiException
+from .transport import Transport, RequestsTransport
 
 '''HTTP client
 '''
@@ -15,24 +15,47 @@ class Client:
     '''An HTTP client that interacts with the SecureDrop API.
     '''
 
-    def __init__(self, url_base: str, authentication: Authentication, user_agent: str=None) -> None:
+    def __init__(self, url_base: str, authentication: Authentication, user_agent: str=None,
+                 transport: Transport=None) -> None:
         ''':param url_base: URL of the SecureDrop
            :param authentication: A :class:`.auth.Authentication` used to perfor the initial
                                   authentication.
            :param user_agent: An optional string that will be used to genreate the ``User-Agen``
                               header
+           :param transport: An optional :class:`.transport.Transport`. Defaults to a
+                             :class:`.transport.RequestsTransport`, which is closed by
+                             :meth:`close`. A transport passed in is left open for the caller
+                             to close.
         '''
         if not url_base.endswith('/'):
             url_base = url_base + '/'
         self.url_base = url_base
 
-        self.authentication = authentication.authenticate(url_base)
+        self.__owns_transport = transport is None
+        self.transport = transport or RequestsTransport()
+        try:
+            self.authentication = authentication.authenticate(url_base, self.transport)
+        except Exception:
+            self.close()
+            raise
 
         if user_agent:
             self.user_agent = '{} (python-securedrop-api/{})'.format(user_agent, __version__)
         else:
             self.user_agent = 'python-securedrop-api/{}'.format(__version__)
 
+    def close(self) -> None:
+        '''Close the transport and its pooled connections if this client created it.
+        '''
+        if self.__owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def __request(self, method=None, path=None, json=None, headers=None):
         _headers = {
             'Accept': 'application/json',
@@ -50,12 +73,7 @@ class Client:
             _headers.update(**auth.headers)
 
         url = '{}{}{}'.format(self.url_base, API_V1, path)
-        return requests.request(
-            method=method,
-            url=url,
-            json=json,
-            headers=_headers,
-            allow_redirects=True)
+        return self.transport.request(method, url, json=json, headers=_headers)
 
     def sources(self) -> Sources:
         '''Get an object containing information about all sources.
@@ -2,6 +2,8 @@ from datetime import datetime
 
 from json_serde import JsonSerde, String, Integer, IsoDateTime, List, Boolean, Nested, Uuid
 
+from ._serde import Frozen
+
 
 class Source(JsonSerde):
 
@@ -14,6 +16,13 @@ class Source(JsonSerde):
     number_of_messages = Integer()
 
 
+class FrozenSource(Frozen):
+
+    __model__ = Source
+    __fields__ = ('uuid', 'journalist_designation', 'last_updated', 'flagged',
+                  'interaction_count', 'number_of_documents', 'number_of_messages')
+
+
 class Sources(JsonSerde):
 
     sources = List(Source)
@@ -27,6 +36,12 @@ class Submission(JsonSerde):
     size = Integer()
 
 
+class FrozenSubmission(Frozen):
+
+    __model__ = Submission
+    __fields__ = ('submission_id', 'filename', 'is_read', 'size')
+
+
 class Submissions(JsonSerde):
 
     submissions = List(Submission)
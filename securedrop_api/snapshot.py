@@ -0,0 +1,203 @@
+import json
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+
+from collections.abc import Sequence
+
+from .data import Sources, Source, Submissions, Submission
+
+'''Compact on-disk snapshots of :class:`.data.Sources` and :class:`.data.Submissions`
+
+A snapshot file is laid out as:
+
+    header  | magic (4s) | version (H) | kind (B) | pad (x) | count (Q) | crc32 (I) |
+            | fields length (I) |
+    fields  | the field names as a UTF-8 JSON array, recorded once
+    index   | ``count + 1`` little-endian ``Q`` offsets into the data region
+    data    | each row as a compact UTF-8 JSON array of the model's ``to_json()`` values, in the
+            | order of the field names, with ``null`` for absent fields
+
+The CRC32 covers everything after the header. Rows are only decoded when they are accessed, so
+opening a large snapshot costs a single ``mmap`` plus the integrity check.
+'''
+
+MAGIC = b'SDSS'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sHBxQII')
+_OFFSET = struct.Struct('<Q')
+
+_KINDS = {
+    1: (Sources, 'sources', Source),
+    2: (Submissions, 'submissions', Submission),
+}
+
+
+class SnapshotError(Exception):
+    '''Generic error for unreadable or corrupt snapshots.
+    '''
+
+    pass
+
+
+def _kind_for(collection) -> int:
+    for kind, (typ, _, _) in _KINDS.items():
+        if isinstance(collection, typ):
+            return kind
+    raise TypeError('Can only snapshot `Sources` or `Submissions` objects.')
+
+
+def dump(collection, path: str) -> None:
+    '''Write a snapshot of a collection to disk.
+       :param collection: A :class:`.data.Sources` or :class:`.data.Submissions`
+       :param path: Where to write the snapshot
+    '''
+    kind = _kind_for(collection)
+    _, attr, _ = _KINDS[kind]
+    rows = [row.to_json() for row in getattr(collection, attr) or []]
+
+    # field names in order of first appearance, so optional fields missing from early rows are
+    # still recorded
+    names = {}
+    for row in rows:
+        for name in row:
+            names.setdefault(name, len(names))
+    fields = sorted(names, key=names.get)
+
+    index = bytearray()
+    data = bytearray()
+    for row in rows:
+        index += _OFFSET.pack(len(data))
+        data += json.dumps([row.get(name) for name in fields],
+                           separators=(',', ':'), default=str).encode('utf-8')
+    index += _OFFSET.pack(len(data))
+
+    fields = json.dumps(fields, separators=(',', ':')).encode('utf-8')
+    crc = zlib.crc32(data, zlib.crc32(index, zlib.crc32(fields)))
+
+    # write to a sibling file and rename it into place so readers that still have the previous
+    # snapshot mapped are never handed a truncated file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)),
+                                    prefix='.{}.'.format(os.path.basename(path)),
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, kind, len(rows), crc, len(fields)))
+            f.write(fields)
+            f.write(index)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load(path: str, verify: bool=True) -> 'Snapshot':
+    '''Open a snapshot from disk.
+       :param path: Path to a file written by :func:`dump`
+       :param verify: Whether to check the snapshot's CRC32 before returning. This reads the
+                      whole file, so it is O(file size); pass ``False`` to open in constant time.
+    '''
+    return Snapshot(path, verify=verify)
+
+
+class Snapshot(Sequence):
+    '''A read-only, memory-mapped view of a snapshot. Rows are deserialized on access.
+    '''
+
+    def __init__(self, path: str, verify: bool=True) -> None:
+        ''':param path: Path to a file written by :func:`dump`
+           :param verify: Whether to check the snapshot's CRC32. This is O(file size).
+        '''
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < _HEADER.size:
+                raise SnapshotError('Snapshot too short for header')
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.__parse_header(verify)
+        except Exception:
+            self.close()
+            raise
+
+    def __parse_header(self, verify: bool) -> None:
+        magic, version, kind, count, crc, fields_len = _HEADER.unpack_from(self.__mmap, 0)
+        if magic != MAGIC:
+            raise SnapshotError('Not a snapshot: bad magic {!r}'.format(magic))
+        if version != VERSION:
+            raise SnapshotError('Unsupported snapshot version: {}'.format(version))
+        if kind not in _KINDS:
+            raise SnapshotError('Unknown snapshot kind: {}'.format(kind))
+
+        self.__index_start = _HEADER.size + fields_len
+        if len(self.__mmap) < self.__index_start:
+            raise SnapshotError('Snapshot truncated in fields')
+        try:
+            self.__fields = json.loads(self.__mmap[_HEADER.size:self.__index_start].decode('utf-8'))
+        except ValueError:
+            raise SnapshotError('Snapshot has corrupt field names')
+
+        self.__data_start = self.__index_start + (count + 1) * _OFFSET.size
+        if len(self.__mmap) < self.__data_start:
+            raise SnapshotError('Snapshot truncated in index')
+
+        self.__count = count
+        self.__kind = kind
+        data_len = self.__offset(count)
+        if len(self.__mmap) != self.__data_start + data_len:
+            raise SnapshotError('Snapshot truncated in data')
+
+        if verify:
+            # checksum through a memoryview so the mapped file isn't copied onto the heap
+            with memoryview(self.__mmap) as view, view[_HEADER.size:] as body:
+                if zlib.crc32(body) != crc:
+                    raise SnapshotError('Snapshot failed integrity check')
+
+    def __offset(self, i: int) -> int:
+        return _OFFSET.unpack_from(self.__mmap, self.__index_start + i * _OFFSET.size)[0]
+
+    @property
+    def collection_type(self) -> type:
+        '''Either :class:`.data.Sources` or :class:`.data.Submissions`.
+        '''
+        return _KINDS[self.__kind][0]
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.__count))]
+        if i < 0:
+            i += self.__count
+        if not 0 <= i < self.__count:
+            raise IndexError('Snapshot index out of range')
+
+        start = self.__data_start + self.__offset(i)
+        end = self.__data_start + self.__offset(i + 1)
+        values = json.loads(self.__mmap[start:end].decode('utf-8'))
+        row = {name: value for name, value in zip(self.__fields, values) if value is not None}
+        return _KINDS[self.__kind][2].from_json(row)
+
+    def to_collection(self):
+        '''Deserialize every row into a :class:`.data.Sources` or :class:`.data.Submissions`.
+        '''
+        typ, attr, _ = _KINDS[self.__kind]
+        return typ(**{attr: list(self)})
+
+    def close(self) -> None:
+        self.__mmap.close()
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
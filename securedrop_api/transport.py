@@ -0,0 +1,167 @@
+import json as json_
+import warnings
+
+'''Pluggable HTTP transports used by :class:`.client.Client` and the authenticators
+
+Every transport exposes ``request(method, url, json=None, headers=None)`` and returns an object
+with ``status_code``, ``headers``, ``content``, ``text`` and ``json()``, the subset of
+``requests.Response`` this package relies on.
+'''
+
+
+def _accept_encoding() -> str:
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+    return ', '.join(encodings)
+
+
+class Transport:
+    '''Abstract class for HTTP transports.
+    '''
+
+    def request(self, method: str, url: str, json: dict=None, headers: dict=None):
+        ''':param method: HTTP method
+           :param url: Absolute URL
+           :param json: Optional JSON body
+           :param headers: Additional HTTP headers
+        '''
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class RequestsTransport(Transport):
+    '''HTTP/1.1 transport backed by a pooled ``requests.Session``. Responses compressed with gzip,
+       deflate, or brotli (if ``brotli`` is installed) are decoded by urllib3 as they stream in.
+    '''
+
+    def __init__(self, session=None, pool_maxsize: int=None) -> None:
+        ''':param session: An optional, preconfigured ``requests.Session`` (e.g. with Tor proxies)
+           :param pool_maxsize: Connections kept per host. Set this to the number of threads
+                                sharing the transport so connections aren't discarded and
+                                re-established. Defaults to urllib3's 10. Not allowed with
+                                ``session``, whose adapters are left as configured.
+        '''
+        if session is not None and pool_maxsize is not None:
+            raise ValueError('pool_maxsize cannot be used with a preconfigured session; '
+                             'mount an HTTPAdapter on the session instead')
+        if session is None:
+            import requests
+            session = requests.Session()
+            if pool_maxsize is not None:
+                from requests.adapters import HTTPAdapter
+                adapter = HTTPAdapter(pool_maxsize=pool_maxsize)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+        session.headers['Accept-Encoding'] = _accept_encoding()
+        self.session = session
+
+    def request(self, method: str, url: str, json: dict=None, headers: dict=None):
+        return self.session.request(method=method,
+                                    url=url,
+                                    json=json,
+                                    headers=headers,
+                                    allow_redirects=True)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Http2Transport(Transport):
+    '''HTTP/2 transport backed by ``httpx``. Concurrent calls from multiple threads are
+       multiplexed over a single connection. Requires ``pip install securedrop-api[http2]``.
+
+       Over ``https://`` HTTP/2 is negotiated with TLS ALPN. Plain ``http://`` URLs, such as most
+       onion services, only speak HTTP/2 with ``prior_knowledge=True``; otherwise httpx falls back
+       to HTTP/1.1 and a warning is issued.
+    '''
+
+    def __init__(self, client=None, prior_knowledge: bool=False, **kwargs) -> None:
+        ''':param client: An optional, preconfigured ``httpx.Client``
+           :param prior_knowledge: Speak HTTP/2 without negotiation (disables HTTP/1.1), for
+                                   cleartext servers known to support it
+           :param kwargs: Passed to ``httpx.Client`` if ``client`` is not given
+        '''
+        if client is None:
+            try:
+                import httpx
+            except ImportError:
+                raise ImportError('Http2Transport requires httpx: '
+                                  'pip install securedrop-api[http2]')
+            client = httpx.Client(http1=not prior_knowledge, http2=True, follow_redirects=True,
+                                  **kwargs)
+        client.headers['Accept-Encoding'] = _accept_encoding()
+        self.client = client
+        self.__warned = False
+
+    def request(self, method: str, url: str, json: dict=None, headers: dict=None):
+        resp = self.client.request(method, url, json=json, headers=headers)
+        if resp.http_version != 'HTTP/2' and not self.__warned:
+            self.__warned = True
+            warnings.warn('Http2Transport fell back to {} for {}; use prior_knowledge=True for '
+                          'cleartext HTTP/2 servers'.format(resp.http_version, url))
+        return resp
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class Response:
+    '''Minimal response returned by :class:`MemoryTransport`.
+    '''
+
+    def __init__(self, status_code: int, content: bytes=b'', headers: dict=None) -> None:
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json_.loads(self.text)
+
+
+class MemoryTransport(Transport):
+    '''In-memory transport for tests. Responses are registered per method and URL, and every
+       request is recorded in ``requests``.
+    '''
+
+    def __init__(self) -> None:
+        self.routes = {}
+        self.requests = []
+
+    def add(self, method: str, url: str, status_code: int=200, json=None,
+            content: bytes=b'') -> None:
+        ''':param method: HTTP method to match
+           :param url: Absolute URL to match
+           :param status_code: Status code of the response
+           :param json: Response body that will be serialized as JSON
+           :param content: Raw response body, used if ``json`` is ``None``
+        '''
+        if json is not None:
+            content = json_.dumps(json).encode('utf-8')
+        self.routes[(method.upper(), url)] = Response(status_code, content)
+
+    def request(self, method: str, url: str, json: dict=None, headers: dict=None):
+        self.requests.append((method.upper(), url, json, headers))
+        try:
+            return self.routes[(method.upper(), url)]
+        except KeyError:
+            return Response(404, b'{"message": "Not Found"}')
@@ -18,12 +18,21 @@ setuptools.setup(
     long_description_content_type='text/markdown',
     package_dir={'securedrop_api': 'securedrop_api'},
     packages=['securedrop_api'],
+    entry_points={
+        'console_scripts': [
+            'securedrop-api = securedrop_api.cli:main',
+        ],
+    },
     platforms='any',
     python_requires='>=3.4',
     install_requires=[
         'requests',
         'json-serde',
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'brotli': ['brotli'],
+    },
     classifiers=(
         'Development Status :: 2 Pre-Alpha',
         'Intended Audience :: Developers',
@@ -0,0 +1,176 @@
+import io
+import json
+
+import pytest
+
+from securedrop_api import client as client_module
+from securedrop_api.cli import main
+from securedrop_api.data import Sources, Submissions, User
+from securedrop_api.exc import ApiException
+
+SOURCE_UUIDS = ['{:08x}-0000-4000-8000-000000000000'.format(i) for i in range(5)]
+
+
+class FakeClient:
+
+    def __init__(self) -> None:
+        self.fetched = []
+
+    def sources(self) -> Sources:
+        return Sources.from_json({
+            'sources': [
+                {
+                    'uuid': uuid,
+                    'journalist_designation': 'foo bar',
+                    'flagged': False,
+                    'last_updated': '2018-01-01T00:00:00Z',
+                    'number_of_messages': 2,
+                    'number_of_documents': 3,
+                    'interaction_count': 4,
+                }
+                for uuid in SOURCE_UUIDS
+            ],
+        })
+
+    def user(self) -> User:
+        return User.from_json({
+            'user': {
+                'is_admin': True,
+                'last_login': '2018-01-01T00:00:00Z',
+                'username': 'journalist',
+            },
+        })
+
+    def source_submissions(self, uuid) -> Submissions:
+        self.fetched.append(str(uuid))
+        return Submissions.from_json({
+            'submissions': [{'submission_id': i, 'filename': 'foo', 'is_read': False, 'size': 4}
+                            for i in range(2)],
+        })
+
+
+def test_export_sources_ndjson(capsys):
+    assert main(['export', 'sources'], client=FakeClient()) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)['uuid'] for line in lines] == SOURCE_UUIDS
+
+
+def test_export_error_exit_status(capsys):
+    class FailingClient(FakeClient):
+
+        def source_submissions(self, uuid) -> Submissions:
+            raise ApiException('Unexpected response: 500')
+
+    assert main(['export', 'submissions'], client=FailingClient()) == 1
+    err = capsys.readouterr().err
+    assert err == 'securedrop-api: ApiException: Unexpected response: 500\n'
+
+
+def test_export_user_iso_datetime(capsys):
+    main(['export', 'user'], client=FakeClient())
+    assert json.loads(capsys.readouterr().out) == {'username': 'journalist',
+                                                   'is_admin': True,
+                                                   'last_login': '2018-01-01T00:00:00Z'}
+
+
+def test_export_submissions_csv(tmpdir, capsys):
+    out = str(tmpdir.join('out.csv'))
+    main(['export', 'submissions', '--format', 'csv', '-o', out, '--workers', '2', '--stats'],
+         client=FakeClient())
+
+    with open(out) as f:
+        lines = f.read().splitlines()
+    assert lines[0].startswith('source_uuid,')
+    assert len(lines) == 1 + 2 * len(SOURCE_UUIDS)
+    assert 'rows=10' in capsys.readouterr().err
+
+
+class Interrupted(Exception):
+    pass
+
+
+class InterruptingClient(FakeClient):
+    '''Fails while writing the second submission of the source at ``fail_at``.
+    '''
+
+    def __init__(self, fail_at: int) -> None:
+        super().__init__()
+        self.fail_at = fail_at
+
+    def source_submissions(self, uuid) -> Submissions:
+        submissions = super().source_submissions(uuid)
+        if str(uuid) == SOURCE_UUIDS[self.fail_at]:
+            def to_json():
+                raise Interrupted()
+            submissions.submissions[1].to_json = to_json
+        return submissions
+
+
+def test_export_submissions_resume(tmpdir):
+    out = tmpdir.join('out.ndjson')
+    checkpoint = tmpdir.join('checkpoint')
+    argv = ['export', 'submissions', '-o', str(out), '--checkpoint', str(checkpoint),
+            '--workers', '1']
+
+    assert main(argv, client=InterruptingClient(fail_at=3)) == 1
+    # simulate a partial buffer flush in the middle of the interrupted source
+    with open(str(out), 'a') as f:
+        f.write('{"source_uuid":"' + SOURCE_UUIDS[3])
+
+    client = FakeClient()
+    main(argv, client=client)
+
+    # the source after the failing one may already have been written, so it can be skipped too
+    assert SOURCE_UUIDS[3] in client.fetched
+    assert not set(client.fetched) & set(SOURCE_UUIDS[:3])
+    assert not checkpoint.exists()
+    rows = [json.loads(line) for line in out.readlines()]
+    assert sorted((r['source_uuid'], r['submission_id']) for r in rows) == \
+        sorted((uuid, i) for uuid in SOURCE_UUIDS for i in range(2))
+
+
+def test_export_submissions_checkpoint_rerun(tmpdir):
+    out = tmpdir.join('out.ndjson')
+    checkpoint = str(tmpdir.join('checkpoint'))
+
+    for _ in range(2):
+        client = FakeClient()
+        main(['export', 'submissions', '-o', str(out), '--checkpoint', checkpoint], client=client)
+        assert sorted(client.fetched) == SOURCE_UUIDS
+        assert len(out.readlines()) == 2 * len(SOURCE_UUIDS)
+
+
+def test_export_checkpoint_only_for_submissions(tmpdir):
+    with pytest.raises(SystemExit):
+        main(['export', 'sources', '-o', str(tmpdir.join('out')),
+              '--checkpoint', str(tmpdir.join('checkpoint'))],
+             client=FakeClient())
+
+
+def test_export_checkpoint_requires_output(tmpdir):
+    with pytest.raises(SystemExit):
+        main(['export', 'submissions', '--checkpoint', str(tmpdir.join('checkpoint'))],
+             client=FakeClient())
+
+
+def test_one_time_code_prompt_not_on_stdout(monkeypatch, capsys):
+    created = []
+
+    class StubClient(FakeClient):
+
+        def __init__(self, url_base, authentication, transport=None) -> None:
+            super().__init__()
+            created.append(authentication)
+
+    monkeypatch.setattr(client_module, 'Client', StubClient)
+    monkeypatch.setenv('SECUREDROP_PASSPHRASE', 'passphrase')
+    monkeypatch.delenv('SECUREDROP_ONE_TIME_CODE', raising=False)
+    monkeypatch.setattr('sys.stdin', io.StringIO('123456\n'))
+
+    assert main(['--url', 'http://sd.example', '--username', 'journalist',
+                 'export', 'sources']) == 0
+
+    out, err = capsys.readouterr()
+    assert [json.loads(line)['uuid'] for line in out.splitlines()] == SOURCE_UUIDS
+    assert 'One time code' in err
+    assert created[0].one_time_code == '123456'
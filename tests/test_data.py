@@ -1,4 +1,10 @@
-from securedrop_api.data import Sources, Source, User
+import gc
+import pickle
+import uuid
+import pytest
+
+from securedrop_api import _serde
+from securedrop_api.data import Sources, Source, Submission, User, FrozenSource, FrozenSubmission
 
 
 def test_sources_serde():
@@ -48,3 +54,67 @@ def test_user_serde():
 
     user = User.from_json(json)
     assert user.username == json['user']['username']
+
+
+def frozen_source_json(**kwargs) -> dict:
+    json = {
+        'uuid': '00000000-0000-4000-8000-000000000000',
+        'journalist_designation': 'foo bar',
+        'flagged': True,
+        'last_updated': '2018-01-01T00:00:00Z',
+        'number_of_messages': 2,
+        'number_of_documents': 3,
+        'interaction_count': 4,
+    }
+    json.update(kwargs)
+    return json
+
+
+def test_frozen_source():
+    a = FrozenSource.from_json(frozen_source_json())
+    b = FrozenSource.from_json(frozen_source_json())
+
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert a.uuid is b.uuid
+    assert a.journalist_designation is b.journalist_designation
+    assert a.thaw() == Source.from_json(frozen_source_json())
+    assert pickle.loads(pickle.dumps(a)) == a
+
+    with pytest.raises(AttributeError):
+        a.flagged = False
+
+    with pytest.raises(TypeError):
+        FrozenSource('foo')
+
+
+def test_frozen_fields_match_models():
+    # the frozen field lists are written out by hand, so catch them drifting from the models
+    json = frozen_source_json()
+    assert FrozenSource.from_json(json).to_json() == Source.from_json(json).to_json()
+
+    json = {'submission_id': 1, 'filename': 'foo', 'is_read': False, 'size': 4}
+    assert FrozenSubmission.from_json(json).to_json() == Submission.from_json(json).to_json()
+
+
+def test_frozen_diff():
+    a = FrozenSource.from_json(frozen_source_json())
+    b = FrozenSource.from_json(frozen_source_json(flagged=False, interaction_count=5))
+
+    assert a.diff(a) == {}
+    assert a.diff(b) == {'flagged': (True, False), 'interaction_count': (4, 5)}
+
+    with pytest.raises(TypeError):
+        a.diff(FrozenSubmission(1, 'foo', False, 4))
+
+
+def test_interned_uuids_are_released():
+    before = len(_serde._INTERNED_UUIDS)
+    uuids = [_serde.intern(uuid.uuid4()) for _ in range(1000)]
+    assert _serde.intern(uuid.UUID(str(uuids[0]))) is uuids[0]
+    assert len(_serde._INTERNED_UUIDS) == before + 1000
+
+    del uuids
+    gc.collect()
+    assert len(_serde._INTERNED_UUIDS) == before
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget for ``securedrop_api.client`` in microseconds. Bump this
+# deliberately (and note it in the changelog) if a release needs to exceed it.
+IMPORT_BUDGET_US = 100000
+
+
+def run_python(*args):
+    proc = subprocess.Popen([sys.executable] + list(args),
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    stdout, stderr = proc.communicate()
+    assert proc.returncode == 0, stderr
+    return stdout, stderr
+
+
+def test_import_is_lazy():
+    stdout, _ = run_python('-c', 'import sys, securedrop_api.client, securedrop_api.auth; '
+                                 'print("requests" in sys.modules)')
+    assert stdout.strip() == 'False'
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='-X importtime requires python 3.7')
+def test_import_time_budget():
+    _, stderr = run_python('-X', 'importtime', '-c', 'import securedrop_api.client')
+    for line in stderr.splitlines():
+        # format: "import time: <self us> | <cumulative us> | <module>"
+        _, cumulative, module = line.split('|')
+        if module.strip() == 'securedrop_api.client':
+            assert int(cumulative) < IMPORT_BUDGET_US
+            break
+    else:
+        pytest.fail('securedrop_api.client not found in importtime output')
@@ -0,0 +1,112 @@
+import struct
+
+import pytest
+
+from securedrop_api.data import Sources, Submissions
+from securedrop_api.snapshot import dump, load, SnapshotError, VERSION
+
+
+def mk_sources() -> Sources:
+    return Sources.from_json({
+        'sources': [
+            {
+                'uuid': '{:08x}-0000-4000-8000-000000000000'.format(i),
+                'journalist_designation': 'foo bar {}'.format(i),
+                'flagged': bool(i % 2),
+                'last_updated': '2018-01-01T00:00:00Z',
+                'number_of_messages': 2,
+                'number_of_documents': 3,
+                'interaction_count': i,
+            }
+            for i in range(10)
+        ],
+    })
+
+
+def test_snapshot_sources_roundtrip(tmpdir):
+    path = str(tmpdir.join('sources.snap'))
+    sources = mk_sources()
+    dump(sources, path)
+
+    with load(path) as snapshot:
+        assert snapshot.collection_type is Sources
+        assert len(snapshot) == 10
+        assert snapshot[3] == sources.sources[3]
+        assert snapshot[-1] == sources.sources[-1]
+        assert snapshot.to_collection() == sources
+
+
+def test_snapshot_submissions_roundtrip(tmpdir):
+    path = str(tmpdir.join('submissions.snap'))
+    submissions = Submissions.from_json({
+        'submissions': [{'submission_id': 1, 'filename': 'foo', 'is_read': False, 'size': 4}],
+    })
+    dump(submissions, path)
+
+    with load(path) as snapshot:
+        assert snapshot.collection_type is Submissions
+        assert list(snapshot) == submissions.submissions
+
+
+def test_snapshot_corrupt(tmpdir):
+    path = str(tmpdir.join('sources.snap'))
+    dump(mk_sources(), path)
+
+    with open(path, 'r+b') as f:
+        f.seek(-2, 2)
+        f.write(b'!!')
+
+    with pytest.raises(SnapshotError):
+        load(path)
+
+
+def test_snapshot_bad_magic(tmpdir):
+    path = str(tmpdir.join('junk.snap'))
+    with open(path, 'wb') as f:
+        f.write(b'\0' * 64)
+
+    with pytest.raises(SnapshotError):
+        load(path)
+
+
+def test_snapshot_empty_file(tmpdir):
+    path = tmpdir.join('empty.snap')
+    path.write(b'', mode='wb')
+
+    with pytest.raises(SnapshotError):
+        load(str(path))
+
+
+def test_snapshot_version_mismatch(tmpdir):
+    path = str(tmpdir.join('sources.snap'))
+    dump(mk_sources(), path)
+
+    with open(path, 'r+b') as f:
+        f.seek(4)
+        f.write(struct.pack('<H', VERSION + 1))
+
+    with pytest.raises(SnapshotError, match='version'):
+        load(path)
+
+
+def test_snapshot_dump_replaces_mapped_file(tmpdir):
+    path = str(tmpdir.join('sources.snap'))
+    sources = mk_sources()
+    dump(sources, path)
+
+    with load(path) as old:
+        dump(Sources(sources=sources.sources[:2]), path)
+        # the old mapping still sees the complete previous snapshot
+        assert old[9] == sources.sources[9]
+
+    with load(path) as new:
+        assert len(new) == 2
+    assert tmpdir.listdir() == [tmpdir.join('sources.snap')]
+
+
+def test_snapshot_records_field_names_once(tmpdir):
+    path = str(tmpdir.join('sources.snap'))
+    dump(mk_sources(), path)
+
+    with open(path, 'rb') as f:
+        assert f.read().count(b'journalist_designation') == 1
@@ -0,0 +1,133 @@
+import gzip
+import sys
+import types
+
+import pytest
+import requests
+import requests_mock
+
+from securedrop_api import client as client_module
+from securedrop_api.auth import UserPassOtp, AuthToken, AuthenticationError
+from securedrop_api.client import Client
+from securedrop_api.transport import MemoryTransport, RequestsTransport, Http2Transport
+
+URL = 'http://sd.example/'
+TOKEN = {'token': 'foobar', 'expiration': '2018-01-01T00:00:00Z'}
+
+
+def test_client_memory_transport():
+    transport = MemoryTransport()
+    transport.add('POST', URL + 'api/v1/token', json=TOKEN)
+    transport.add('GET', URL + 'api/v1/user', json={
+        'user': {
+            'is_admin': True,
+            'last_login': '2018-01-01T00:00:00Z',
+            'username': 'journalist',
+        },
+    })
+
+    client = Client(URL, UserPassOtp('journalist', 'passphrase', '123456'), transport=transport)
+    assert isinstance(client.authentication, AuthToken)
+    assert client.user().username == 'journalist'
+
+    method, url, json, headers = transport.requests[-1]
+    assert (method, url) == ('GET', URL + 'api/v1/user')
+    assert headers['Authorization'] == 'Token foobar'
+
+
+class ClosingTransport(MemoryTransport):
+    closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_client_closes_own_transport(monkeypatch):
+    transport = ClosingTransport()
+    transport.add('POST', URL + 'api/v1/token', json=TOKEN)
+    monkeypatch.setattr(client_module, 'RequestsTransport', lambda: transport)
+
+    with Client(URL, AuthToken.from_json(TOKEN)):
+        assert not transport.closed
+    assert transport.closed
+
+
+def test_client_leaves_callers_transport_open():
+    transport = ClosingTransport()
+    with pytest.raises(AuthenticationError):
+        Client(URL, AuthToken.from_json(TOKEN), transport=transport)
+    assert not transport.closed
+
+    transport.add('POST', URL + 'api/v1/token', json=TOKEN)
+    with Client(URL, AuthToken.from_json(TOKEN), transport=transport):
+        pass
+    assert not transport.closed
+
+
+def test_requests_transport_pool_maxsize():
+    with RequestsTransport(pool_maxsize=32) as transport:
+        assert transport.session.get_adapter(URL)._pool_maxsize == 32
+
+
+def test_requests_transport_pool_maxsize_with_session():
+    session = requests.Session()
+    with pytest.raises(ValueError):
+        RequestsTransport(session=session, pool_maxsize=32)
+    session.close()
+
+
+def test_token_authenticate_returns_self():
+    transport = MemoryTransport()
+    transport.add('POST', URL + 'api/v1/token', json=TOKEN)
+    token = AuthToken.from_json(TOKEN)
+    assert token.authenticate(URL, transport) is token
+
+
+@pytest.mark.parametrize('brotli', [True, False])
+def test_requests_transport_accept_encoding(monkeypatch, brotli):
+    # ``None`` in sys.modules makes the import raise ImportError
+    monkeypatch.setitem(sys.modules, 'brotli', types.ModuleType('brotli') if brotli else None)
+    monkeypatch.setitem(sys.modules, 'brotlicffi', None)
+
+    with requests_mock.Mocker() as m:
+        m.get(URL, json={})
+        with RequestsTransport() as transport:
+            transport.request('GET', URL)
+        encodings = m.last_request.headers['Accept-Encoding'].split(', ')
+    assert encodings[:2] == ['gzip', 'deflate']
+    assert ('br' in encodings) is brotli
+
+
+def test_requests_transport_decodes_gzip():
+    with requests_mock.Mocker() as m:
+        m.get(URL, content=gzip.compress(b'{"ok": true}'), headers={'Content-Encoding': 'gzip'})
+        with RequestsTransport() as transport:
+            assert transport.request('GET', URL).json() == {'ok': True}
+
+
+def test_http2_transport():
+    httpx = pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={'ok': True}, extensions={'http_version': b'HTTP/2'})
+
+    with Http2Transport(prior_knowledge=True, transport=httpx.MockTransport(handler)) as transport:
+        resp = transport.request('POST', URL, json={'a': 1}, headers={'X-Foo': 'bar'})
+
+    assert resp.json() == {'ok': True}
+    assert seen[0].headers['X-Foo'] == 'bar'
+    assert 'gzip' in seen[0].headers['Accept-Encoding']
+
+
+def test_http2_transport_warns_on_fallback():
+    httpx = pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+
+    transport = Http2Transport(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+    with pytest.warns(UserWarning, match='prior_knowledge'):
+        transport.request('GET', URL)
+    transport.close()